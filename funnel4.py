@@ -1,17 +1,41 @@
 #!/usr/bin/env python3
-from html.parser import HTMLParser
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import argparse
 from datetime import datetime, timezone
+import html
 import logging
 import os
 import os.path
+import pickle
+import re
 import shutil
 
 from bs4 import BeautifulSoup
-from docutils.core import publish_parts
-from jinja2 import Environment, FileSystemLoader
+from docutils import io as docutils_io
+from docutils.core import Publisher
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 import yaml
 
+try:
+  # 10-20x faster than the pure-Python loader when libyaml is available.
+  from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+  from yaml import SafeLoader as _YamlLoader
+
+# Bump this whenever the structure of the cached contexts changes, so stale
+# on-disk caches are discarded rather than misinterpreted.
+_CACHE_VERSION = 1
+
+# The top-level source directory that never produces output; the walks skip
+# this whole subtree before descending rather than filtering per file.
+_TEMPLATES_DIR = "templates"
+
+# A source file with its derived path pieces computed once, so the path
+# helpers don't redo splitext/dirname scans for every use. stem is the full
+# path minus the extension; rel is the path relative to src_path.
+FileRec = namedtuple("FileRec", "path rel dirpath stem ext")
+
 def main():
   parser = argparse.ArgumentParser(description="Generate a static website.")
   parser.add_argument("-c", "--config", nargs="?", default="funnel4.yml", help="config file path, default to funnel4.yml")
@@ -19,7 +43,7 @@ def main():
 
   if os.path.exists(args.config):
     with open(args.config) as f:
-      config = yaml.safe_load(f.read())
+      config = yaml.load(f, Loader=_YamlLoader)
   else:
     config = {}
 
@@ -28,7 +52,7 @@ def main():
     parser.print_help()
     return
 
-  logging.basicConfig(format="[%(asctime)s][%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S", level=logging.DEBUG)
+  logging.basicConfig(format="[%(asctime)s][%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S", level=logging.INFO)
   website = Website(basedir, config)
   website.generate()
 
@@ -61,44 +85,114 @@ class Website(object):
 
     self.config.update(config)
 
-    self._jinja2_env = Environment(loader=FileSystemLoader(searchpath=os.path.join(self.basedir, "src")))
+    # Cached here because _relative_filename/_href/_out_filename run for
+    # every file; slicing off a known-length prefix is much cheaper than
+    # str.replace scanning the whole path.
+    self._src_path = self.config["src_path"]
+    self._src_path_len = len(self._src_path)
+    self._out_path = self.config["out_path"]
+
+    # Templates never change during a single build, so turn off the
+    # auto-reload stat calls and let the environment cache every template.
+    # The bytecode cache persists compiled templates across invocations so
+    # subsequent runs skip Jinja's parser/compiler entirely.
+    j2cache_dir = os.path.join(self.basedir, ".funnel4-j2cache")
+    os.makedirs(j2cache_dir, exist_ok=True)
+    self._jinja2_env = Environment(
+      loader=FileSystemLoader(searchpath=os.path.join(self.basedir, "src")),
+      auto_reload=False,
+      cache_size=-1,
+      enable_async=False,
+      bytecode_cache=FileSystemBytecodeCache(directory=j2cache_dir),
+    )
     self._jinja2_env.globals["now"] = datetime.utcnow().replace(tzinfo=timezone.utc, microsecond=0)
+    self._template_cache = {}
 
     self._logger = logging.getLogger("funnel4")
-    self._logger.setLevel(logging.DEBUG)
 
-    self._rst_j2context_cache = {}
+    # Keyed by (full_filename, mtime_ns, size) and persisted to disk so
+    # incremental builds skip docutils entirely for unchanged files.
+    self._cache_filename = os.path.join(self.basedir, ".funnel4-cache.pkl")
+    self._rst_j2context_cache = self._load_rst_j2context_cache()
+    # Keys actually used this run; only these are persisted again, so
+    # entries for edited or deleted files don't accumulate forever.
+    self._rst_j2context_cache_used = set()
 
   def generate(self):
+    # Discover blog posts first so their contexts are computed exactly once
+    # and shared between the per-post pages and the feeds.
+    self._blog_posts = self.discover_blog_posts()
+    self._prepare_out_dirs()
     self.generate_static_pages()
     self.generate_blog_feeds()
+    self._save_rst_j2context_cache()
+
+  def _prepare_out_dirs(self, root: str=None):
+    # Mirror the source directory structure under out_path in one pass, so
+    # the per-file hot paths don't each need an os.makedirs (and its
+    # stat syscalls). The templates directory never produces output.
+    if root is None:
+      root = self._src_path
+      os.makedirs(self._out_path, exist_ok=True)
+
+    for entry in os.scandir(root):
+      if not entry.is_dir(follow_symlinks=False):
+        continue
 
-  def generate_static_pages(self):
-    for root, _dirs, files in os.walk(self.config["src_path"]):
-      for file in files:
-        full_filename = os.path.join(root, file)
-        relative_filename = self._relative_filename(full_filename)
-
-        if relative_filename.startswith("templates/"):
-          # Either the templates directory, or a subdirectory of the templates
-          # directory will be skipped.
-          continue
+      if root == self._src_path and entry.name == _TEMPLATES_DIR:
+        continue
 
-        if relative_filename.startswith("static/"):
-          self.copy_static_file(full_filename)
+      os.makedirs(self._out_path + entry.path[self._src_path_len:], exist_ok=True)
+      self._prepare_out_dirs(entry.path)
+
+  def _classify_src_files(self) -> tuple:
+    # Classifying by top-level directory once during the walk means the
+    # rendering loops below don't need to re-test path prefixes for every
+    # file. The templates directory never produces output, so it isn't
+    # descended into at all.
+    static_files = []
+    blog_files = []
+    page_files = []
+
+    for entry in os.scandir(self._src_path):
+      if entry.is_dir(follow_symlinks=False):
+        if entry.name == _TEMPLATES_DIR:
           continue
+        elif entry.name == "static":
+          static_files.extend(self._iter_files(entry.path))
+        elif entry.name == "blog":
+          blog_files.extend(self._iter_files(entry.path))
+        else:
+          page_files.extend(self._iter_files(entry.path))
+      elif entry.is_file(follow_symlinks=False):
+        page_files.append(entry)
 
-        # A jinja2 partial file. Do not render
-        if file.startswith("_") and file.endswith(".html"):
-          continue
+    return static_files, blog_files, page_files
 
-        if relative_filename.startswith("blog/"):
-          self.render_file(full_filename, self.config["blog"]["post_template"])
-        else:
-          self.render_file(full_filename, relative_filename)
+  def generate_static_pages(self):
+    static_files, blog_files, page_files = self._classify_src_files()
+
+    # Blog files were already primed by discover_blog_posts.
+    self._prime_rst_j2context_cache([entry.path for entry in page_files if entry.name.endswith(".rst")])
+
+    for entry in static_files:
+      self.copy_static_file(self._file_rec(entry.path))
+
+    post_template = self.config["blog"]["post_template"]
+    for entry in blog_files:
+      # Reuse the context already computed by discover_blog_posts.
+      self.render_file(self._file_rec(entry.path), post_template, context=self._blog_post_contexts[entry.path])
+
+    for entry in page_files:
+      # A jinja2 partial file. Do not render
+      if entry.name.startswith("_") and entry.name.endswith(".html"):
+        continue
+
+      rec = self._file_rec(entry.path)
+      self.render_file(rec, rec.rel)
 
   def generate_blog_feeds(self):
-    blog_posts = self.discover_blog_posts()
+    blog_posts = self._blog_posts
     n = self.config["blog"]["posts_per_page"]
 
     # Render the paginated main feed first.
@@ -110,109 +204,207 @@ class Website(object):
     if len(all_posts_paginated) == 0:
       all_posts_paginated = [[]]
 
+    # Everything derived from the feed config is constant across pages, so
+    # it is computed once up front: the compiled template, the output
+    # directory (typically absent from the source tree, hence not covered
+    # by _prepare_out_dirs) and the template extension.
+    out_base = self.config["out_path"]
+    num_pages = len(all_posts_paginated)
+
+    feeds_info = []
+    for feed in self.config["blog"]["feeds"]:
+      feed_dir = os.path.join(out_base, feed["path"])
+      os.makedirs(feed_dir, exist_ok=True)
+      feeds_info.append((
+        self._get_template(feed["template"]),
+        feed_dir,
+        os.path.splitext(feed["template"])[1],
+      ))
+
     # Render each page in a loop.
     for i, posts_for_single_page in enumerate(all_posts_paginated):
       page_num = i + 1
       context = {
         "page_num": page_num,
-        "num_pages": len(all_posts_paginated),
+        "num_pages": num_pages,
         "posts": posts_for_single_page,
         "category": "__all__"
       }
 
       # We can have multiple global feeds, so here it is.
-      for feed in self.config["blog"]["feeds"]:
-        ext = os.path.splitext(feed["template"])[1]
-        out_filename = os.path.join(self.config["out_path"], feed["path"], "{}{}".format(page_num, ext))
-        template = self._jinja2_env.get_template(feed["template"])
-        # TODO: probably better to use .stream().dump(multi_io), where multi_io writes to two files simultaneously
-        data = template.render(context)
-
-        self._logger.info("writing blog feed ({}/{}) {}".format(page_num, len(all_posts_paginated), out_filename))
-        os.makedirs(os.path.dirname(out_filename), exist_ok=True)
-        with open(out_filename, "w") as f:
-          f.write(data)
-
-        # Also write the index.html page
+      for template, feed_dir, ext in feeds_info:
+        out_filename = os.path.join(feed_dir, "{}{}".format(page_num, ext))
+
+        self._logger.info("writing blog feed (%d/%d) %s", page_num, num_pages, out_filename)
+        # Stream instead of render so we never hold the full document in
+        # memory as a single string. The first page doubles as the index
+        # page, so both files are written in the same pass.
         if page_num == 1:
-          out_filename = os.path.join(self.config["out_path"], feed["path"], "index{}".format(ext))
-          self._logger.info("writing blog feed ({}/{}) {}".format(page_num, len(all_posts_paginated), out_filename))
-          with open(out_filename, "w") as f:
-            f.write(data)
+          index_out_filename = os.path.join(feed_dir, "index{}".format(ext))
+          self._logger.info("writing blog feed (%d/%d) %s", page_num, num_pages, index_out_filename)
+          with open(out_filename, "wb") as f1, open(index_out_filename, "wb") as f2:
+            template.stream(context).dump(_Tee(f1, f2), encoding="utf-8")
+        else:
+          template.stream(context).dump(out_filename, encoding="utf-8")
 
     # TODO: now render the category index.
     # This is not paginated and everything is dumped in a single page for now.
 
-  def copy_static_file(self, full_filename: str):
-    out_filename = self._out_filename(full_filename, convert_extension=False)
-    self._logger.info("copy static file {} to {}".format(full_filename, out_filename))
-    os.makedirs(os.path.dirname(out_filename), exist_ok=True)
-    shutil.copyfile(full_filename, out_filename)
-
-  def render_file(self, full_filename: str, template_name: str):
-    extension = os.path.splitext(full_filename)[1]
-    out_filename = self._out_filename(full_filename)
-
-    if extension == ".rst":
-      context = self._rst_j2context(full_filename)
-    else:
-      context = {}
+  def _iter_files(self, root: str):
+    # os.scandir yields DirEntry objects whose is_file/is_dir results come
+    # from the directory listing itself, so walking this way avoids the
+    # extra stat call per file that os.walk + os.path.join incurs.
+    try:
+      entries = os.scandir(root)
+    except FileNotFoundError:
+      # os.walk silently skipped missing directories (e.g. a site with no
+      # blog/), so keep that behaviour.
+      return
 
-    self._logger.info("rendering {} with {} context variables and copying to {}".format(
-      full_filename,
+    for entry in entries:
+      if entry.is_dir(follow_symlinks=False):
+        yield from self._iter_files(entry.path)
+      elif entry.is_file(follow_symlinks=False):
+        yield entry
+
+  def _get_template(self, template_name: str):
+    # get_template still asks the loader to stat the file even with caching
+    # enabled, so memoize the compiled templates ourselves.
+    template = self._template_cache.get(template_name)
+    if template is None:
+      template = self._template_cache[template_name] = self._jinja2_env.get_template(template_name)
+    return template
+
+  def copy_static_file(self, rec: FileRec):
+    out_filename = self._out_filename(rec, convert_extension=False)
+    # Lazy %-formatting and DEBUG level so per-file messages cost nothing on
+    # a normal INFO-level build.
+    self._logger.debug("copy static file %s to %s", rec.path, out_filename)
+    _copy_file(rec.path, out_filename)
+
+  def render_file(self, rec: FileRec, template_name: str, context: dict=None):
+    out_filename = self._out_filename(rec)
+
+    if context is None:
+      if rec.ext == ".rst":
+        context = self._rst_j2context(rec.path)
+      else:
+        context = {}
+
+    self._logger.debug(
+      "rendering %s with %d context variables and copying to %s",
+      rec.path,
       len(context),
       out_filename
-    ))
-
-    os.makedirs(os.path.dirname(out_filename), exist_ok=True)
+    )
 
-    template = self._jinja2_env.get_template(template_name)
+    template = self._get_template(template_name)
     template.stream(context).dump(out_filename, encoding="utf-8")
 
   def discover_blog_posts(self):
-    blog_posts = {
-      "__all__": [], # This has a list of all blog posts, regardless which folder
-    }
+    self._blog_post_contexts = {}
 
-    for root, _dirs, files in os.walk(os.path.join(self.config["src_path"], "blog")):
-      for file in files:
-        full_filename = os.path.join(root, file)
-        context = self._rst_j2context(full_filename)
-        for required_metadata_key in ["created_at", "title"]:
-          if required_metadata_key not in context:
-            raise KeyError("{} doesn't define {} in the metadata when it is required".format(full_filename, required_metadata_key))
+    entries = list(self._iter_files(os.path.join(self.config["src_path"], "blog")))
+    self._prime_rst_j2context_cache([entry.path for entry in entries])
+
+    posts = [] # (dirname, context) pairs
+    for entry in entries:
+      full_filename = entry.path
+      context = self._rst_j2context(full_filename)
+      for required_metadata_key in ["created_at", "title"]:
+        if required_metadata_key not in context:
+          raise KeyError("{} doesn't define {} in the metadata when it is required".format(full_filename, required_metadata_key))
 
-        blog_posts["__all__"].append(context)
-        blog_posts.setdefault(os.path.dirname(full_filename), []).append(context)
+      self._blog_post_contexts[full_filename] = context
+      posts.append((os.path.dirname(full_filename), context))
 
+    # Sorting once and building the per-folder lists in that order leaves
+    # every list already sorted, instead of re-sorting each one.
+    posts.sort(key=lambda post: post[1]["created_at"], reverse=True)
+
+    blog_posts = {
+      "__all__": [context for _, context in posts], # This has a list of all blog posts, regardless which folder
+    }
 
-    for _, posts in blog_posts.items():
-      posts.sort(key=lambda post: post["created_at"], reverse=True)
+    for dirname, context in posts:
+      blog_posts.setdefault(dirname, []).append(context)
 
     return blog_posts
 
   def _rst_j2context(self, full_filename: str) -> dict:
-    if full_filename in self._rst_j2context_cache:
-      return self._rst_j2context_cache[full_filename]
+    key = self._rst_cache_key(full_filename)
+    self._rst_j2context_cache_used.add(key)
+    if key in self._rst_j2context_cache:
+      return self._rst_j2context_cache[key]
 
-    with open(full_filename) as f:
-      rst = f.read()
+    _, html, metadata = _parse_rst(full_filename)
+    context = self._rst_j2context_cache[key] = self._build_j2context(full_filename, html, metadata)
+    return context
+
+  def _prime_rst_j2context_cache(self, filenames: list):
+    # publish_parts is pure-Python and CPU-bound, and each file parses
+    # independently, so fan the uncached files out to a process pool. The
+    # cheap context assembly (href, link_base rewriting) stays in this
+    # process since it depends on the config.
+    filenames = [f for f in filenames if self._rst_cache_key(f) not in self._rst_j2context_cache]
 
-    parts = publish_parts(rst, source_path=full_filename, writer_name="html")
-    parser = MetaParser()
-    parser.feed(parts["meta"])
+    if len(filenames) <= 1:
+      for full_filename in filenames:
+        self._rst_j2context(full_filename)
+      return
 
-    html = parts["html_body"]
+    with ProcessPoolExecutor() as executor:
+      for full_filename, html, metadata in executor.map(_parse_rst, filenames, chunksize=8):
+        key = self._rst_cache_key(full_filename)
+        self._rst_j2context_cache_used.add(key)
+        self._rst_j2context_cache[key] = self._build_j2context(full_filename, html, metadata)
+
+  def _rst_cache_key(self, full_filename: str) -> tuple:
+    st = os.stat(full_filename)
+    return (full_filename, st.st_mtime_ns, st.st_size)
+
+  def _load_rst_j2context_cache(self) -> dict:
+    try:
+      with open(self._cache_filename, "rb") as f:
+        cached = pickle.load(f)
+    except Exception:
+      # Missing or corrupt cache files just mean a full rebuild.
+      return {}
+
+    # link_base is baked into the cached contexts, so changing it must
+    # invalidate them as well.
+    if cached.get("version") != _CACHE_VERSION or cached.get("link_base") != self.config["link_base"]:
+      return {}
+
+    return cached["contexts"]
+
+  def _save_rst_j2context_cache(self):
+    # Persisting only the entries touched this run evicts stale versions of
+    # edited posts and entries for deleted files.
+    contexts = {
+      key: self._rst_j2context_cache[key]
+      for key in self._rst_j2context_cache_used
+    }
+
+    with open(self._cache_filename, "wb") as f:
+      pickle.dump({
+        "version": _CACHE_VERSION,
+        "link_base": self.config["link_base"],
+        "contexts": contexts,
+      }, f)
+
+  def _build_j2context(self, full_filename: str, html: str, metadata: dict) -> dict:
+    href = self._href(self._file_rec(full_filename))
 
     if self.config["link_base"]:
-      html = self._transform_anchor_hash(html, self._href(full_filename))
+      html = self._transform_anchor_hash(html, href)
 
     context = {}
-    context.update(parser.metadata)
+    context.update(metadata)
     context.update({
       "html_body": html,
-      "metadata": parser.metadata,
-      "href": self._href(full_filename),
+      "metadata": metadata,
+      "href": href,
     })
 
     return context
@@ -228,59 +420,133 @@ class Website(object):
 
     return str(soup)
 
-  def _href(self, full_filename: str) -> str:
-    if os.path.basename(full_filename) == "index.html":
-      href = os.path.dirname(full_filename.replace(self.config["src_path"], "/")) + "/"
+  def _file_rec(self, full_filename: str) -> FileRec:
+    # These helpers run for every file, so the derived pieces are sliced
+    # off with a precomputed prefix length and a single splitext scan.
+    stem, ext = os.path.splitext(full_filename)
+    return FileRec(
+      path=full_filename,
+      rel=full_filename[self._src_path_len:].lstrip("/"),
+      dirpath=os.path.dirname(full_filename),
+      stem=stem,
+      ext=ext,
+    )
+
+  def _href(self, rec: FileRec) -> str:
+    if rec.ext == ".html" and rec.stem.endswith("/index"):
+      href = rec.dirpath[self._src_path_len:] + "/"
     else:
-      ext = os.path.splitext(full_filename)[1]
-      href = full_filename.replace(self.config["src_path"], "").replace(ext, ".html")
+      href = rec.stem[self._src_path_len:] + ".html"
 
     if self.config["link_base"]:
       href = href.lstrip("/")
 
     return href
 
-  def _out_filename(self, full_filename: str, convert_extension: bool=True) -> str:
-    out_filename = full_filename.replace(self.config["src_path"], self.config["out_path"])
+  def _out_filename(self, rec: FileRec, convert_extension: bool=True) -> str:
     if convert_extension:
-      ext = os.path.splitext(full_filename)[1]
-      out_filename = out_filename.replace(ext, ".html")
-
-    return out_filename
+      return self._out_path + rec.stem[self._src_path_len:] + ".html"
 
-  def _relative_filename(self, full_filename: str) -> str:
-    # This function is called a lot, but that's ok.
-    return full_filename.replace(self.config["src_path"], "").lstrip("/")
+    return self._out_path + rec.path[self._src_path_len:]
 
 
-class MetaParser(HTMLParser):
+class _Tee:
   """
-  This class is needed to parse the metadata for all rst renders. The metadata
-  is only returned by docutils as HTML. We want the metadata to be a part of
-  the context.
+  A minimal writable object forwarding each chunk to several underlying
+  files, so a template stream can be dumped to multiple outputs in one pass.
   """
-  def __init__(self):
-    super().__init__()
+  def __init__(self, *fps):
+    self.fps = fps
 
-    self.metadata = {}
+  def write(self, data):
+    for fp in self.fps:
+      fp.write(data)
 
-  def handle_starttag(self, tag, attrs):
-    if tag != "meta":
-      return
 
-    attrs = dict(attrs)
-    name = attrs.get("name", None)
-    content = attrs.get("content", None)
-    if name is None or content is None:
-      return
+def _copy_file(src: str, dst: str):
+  # os.copy_file_range copies within the kernel (and can reflink on
+  # supporting filesystems), so large static assets never round-trip
+  # through user-space buffers. Fall back to shutil.copyfile where it is
+  # unavailable or unsupported (non-Linux, old kernels, weird filesystems).
+  if not hasattr(os, "copy_file_range"):
+    shutil.copyfile(src, dst)
+    return
 
-    if name in self.metadata:
+  try:
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+      remaining = os.fstat(fsrc.fileno()).st_size
+      while remaining > 0:
+        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+        if copied == 0:
+          break
+        remaining -= copied
+  except OSError:
+    # dst was opened with truncation, so restarting with the generic copy
+    # is safe even if some bytes were already written.
+    shutil.copyfile(src, dst)
+
+
+# Docutils only returns the metadata as a fragment of <meta> tags, so this is
+# needed to get the metadata into the template context. The fragment is small
+# and regular, making precompiled regexes much cheaper than a full HTMLParser
+# state machine. Docutils emits the attributes in varying orders and may add
+# extra ones (e.g. lang from ":description lang=en:"), so each tag is matched
+# whole and name/content are pulled out of it independently.
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>")
+_META_NAME_RE = re.compile(r'\bname="([^"]*)"')
+_META_CONTENT_RE = re.compile(r'\bcontent="([^"]*)"')
+
+
+def _parse_meta(meta_html: str) -> dict:
+  metadata = {}
+  for tag in _META_TAG_RE.findall(meta_html):
+    name_match = _META_NAME_RE.search(tag)
+    content_match = _META_CONTENT_RE.search(tag)
+    if name_match is None or content_match is None:
+      continue
+
+    name = html.unescape(name_match.group(1))
+    if name in metadata:
       raise ValueError("name {} is specified multiple times in the metadata".format(name))
 
     if name in ["created_at", "updated_at"]:
       pass # TODO: parse datetime
 
-    self.metadata[name] = content
+    metadata[name] = html.unescape(content_match.group(1))
+
+  return metadata
+
+
+# Constructing a docutils Publisher (reader, parser, writer, settings) has a
+# significant fixed cost, so one instance is built lazily and reused for every
+# RST file. This is per-process: each ProcessPoolExecutor worker gets its own.
+_rst_publisher = None
+
+
+def _get_rst_publisher() -> Publisher:
+  global _rst_publisher
+  if _rst_publisher is None:
+    publisher = Publisher(source_class=docutils_io.FileInput, destination_class=docutils_io.StringOutput)
+    publisher.set_components("standalone", "restructuredtext", "html")
+    publisher.process_programmatic_settings(None, None, None)
+    _rst_publisher = publisher
+
+  return _rst_publisher
+
+
+def _parse_rst(full_filename: str) -> tuple:
+  # Module-level so it can be pickled into ProcessPoolExecutor workers. The
+  # open file object goes straight to docutils' FileInput rather than being
+  # read into an intermediate string first.
+  publisher = _get_rst_publisher()
+  with open(full_filename) as f:
+    publisher.set_source(f, source_path=full_filename)
+    publisher.set_destination(None, None)
+    publisher.publish()
+
+  parts = publisher.writer.parts
+
+  return full_filename, parts["html_body"], _parse_meta(parts["meta"])
 
 
 if __name__ == "__main__":